@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from uniswapyv3 import fixed_point
+from uniswapyv3.fixed_point import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    encode_price_sqrt,
+    get_sqrt_ratio_at_tick,
+    get_sqrt_ratios_at_ticks,
+    get_tick_at_sqrt_ratio,
+)
+
+# Values returned by TickMath.getSqrtRatioAtTick on-chain
+ON_CHAIN_SQRT_RATIOS = {
+    MIN_TICK: MIN_SQRT_RATIO,
+    -50: 79030349367926598376800521322,
+    -1: 79224201403219477170569942574,
+    0: Q96,
+    1: 79232123823359799118286999568,
+    50: 79426470787362580746886972461,
+    MAX_TICK: MAX_SQRT_RATIO,
+}
+
+
+@pytest.mark.parametrize("tick,sqrt_ratio", ON_CHAIN_SQRT_RATIOS.items())
+def test_get_sqrt_ratio_at_tick_matches_on_chain(tick, sqrt_ratio):
+    assert get_sqrt_ratio_at_tick(tick) == sqrt_ratio
+
+
+@pytest.mark.parametrize("tick", [MIN_TICK - 1, MAX_TICK + 1])
+def test_get_sqrt_ratio_at_tick_out_of_bounds(tick):
+    with pytest.raises(ValueError):
+        get_sqrt_ratio_at_tick(tick)
+
+
+def test_get_sqrt_ratios_at_ticks_matches_scalar():
+    ticks = np.concatenate((
+        list(ON_CHAIN_SQRT_RATIOS),
+        np.random.default_rng(0).integers(MIN_TICK, MAX_TICK + 1, 2000),
+    ))
+    ratios = get_sqrt_ratios_at_ticks(ticks)
+    assert [int(ratio) for ratio in ratios] == [get_sqrt_ratio_at_tick(tick) for tick in ticks]
+
+
+def test_get_sqrt_ratios_at_ticks_across_chunks(monkeypatch):
+    monkeypatch.setattr(fixed_point, "_LIMB_CHUNK_SIZE", 64)
+    ticks = np.arange(-300, 300)
+    ratios = get_sqrt_ratios_at_ticks(ticks)
+    assert [int(ratio) for ratio in ratios] == [get_sqrt_ratio_at_tick(tick) for tick in ticks]
+
+
+def test_get_sqrt_ratios_at_ticks_keeps_shape():
+    ratios = get_sqrt_ratios_at_ticks(np.array([[0, 1], [-1, 50]]))
+    assert ratios.shape == (2, 2)
+    assert ratios.tolist() == [[Q96, ON_CHAIN_SQRT_RATIOS[1]], [ON_CHAIN_SQRT_RATIOS[-1], ON_CHAIN_SQRT_RATIOS[50]]]
+    assert get_sqrt_ratios_at_ticks(np.array([], dtype=np.int64)).size == 0
+
+
+def test_get_tick_at_sqrt_ratio_bounds():
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO + 1) == MIN_TICK
+    assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+    with pytest.raises(ValueError):
+        get_tick_at_sqrt_ratio(MIN_SQRT_RATIO - 1)
+    with pytest.raises(ValueError):
+        get_tick_at_sqrt_ratio(MAX_SQRT_RATIO)
+
+
+@pytest.mark.parametrize("tick", [MIN_TICK + 1, -50, -1, 0, 1, 50, 69080, MAX_TICK - 1])
+def test_get_tick_at_sqrt_ratio_boundaries(tick):
+    sqrt_ratio = get_sqrt_ratio_at_tick(tick)
+    assert get_tick_at_sqrt_ratio(sqrt_ratio) == tick
+    assert get_tick_at_sqrt_ratio(sqrt_ratio - 1) == tick - 1
+
+
+def test_encode_price_sqrt():
+    assert encode_price_sqrt(1) == Q96
+    assert encode_price_sqrt(4) == 2 * Q96
+    assert encode_price_sqrt(0.25) == Q96 // 2
+
+
+@pytest.mark.parametrize("price", [np.float32(1030.0), np.float64(1030.0), np.int64(1030), 1030])
+def test_encode_price_sqrt_accepts_numpy_scalars(price):
+    assert encode_price_sqrt(price) == encode_price_sqrt(1030.0)
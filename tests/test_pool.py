@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from uniswapyv3.fixed_point import Q96, encode_price_sqrt
+from uniswapyv3.pool import LiquidityPool
+
+
+@pytest.fixture
+def fixed_pool():
+    pool = LiquidityPool(tick_space=10, fee=0.003, initial_price=1000, backend="fixed")
+    pool.open_position(900, 1100, 100)
+    return pool
+
+
+def test_fixed_backend_rejects_float_price_writes(fixed_pool):
+    with pytest.raises(AttributeError):
+        fixed_pool.sqrt_price = 31.0
+
+
+def test_float_backend_has_no_fixed_price():
+    pool = LiquidityPool(tick_space=10, fee=0.003, initial_price=1000)
+    assert pool.sqrt_price_x96 is None
+    with pytest.raises(AttributeError):
+        pool.sqrt_price_x96 = Q96
+
+
+def test_swap_without_price_move_keeps_exact_price(fixed_pool):
+    sqrt_price_x96 = fixed_pool.sqrt_price_x96
+    fixed_pool.swap(-5)
+    assert fixed_pool.sqrt_price_x96 == sqrt_price_x96 == encode_price_sqrt(1000)
+
+
+def test_swap_price_is_rounded_down_to_q96(fixed_pool):
+    fixed_pool._set_sqrt_price(31.7)
+    assert fixed_pool.sqrt_price_x96 == int(31.7 * Q96)
+    assert fixed_pool.sqrt_price == 31.7
+
+
+def test_fixed_backend_accepts_numpy_prices(fixed_pool):
+    fixed_pool.update_price(np.float32(1030.0))
+    assert fixed_pool._price_to_tick(np.float32(1030.0)) == fixed_pool._price_to_tick(1030.0)
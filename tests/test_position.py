@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from uniswapyv3.pool import LiquidityPool
+
+
+@pytest.fixture(params=["float", "fixed"])
+def pool(request):
+    return LiquidityPool(tick_space=10, fee=0.003, initial_price=1000, backend=request.param)
+
+
+def expected_metrics(position):
+    price = position.pool.sqrt_price ** 2
+    position.update_reserves()
+    value = position.x * price + position.y
+    hodl_value = position.initial_x * price + position.initial_y
+    fees = position.fees_withdraw + position.fees[0] * price + position.fees[1]
+    return value, (value - hodl_value) / hodl_value, (value - hodl_value + fees) / hodl_value
+
+
+def test_position_is_clean_after_refresh(pool):
+    position = pool.open_position(900, 1100, 100)
+    assert position.is_dirty
+    position.refresh()
+    assert not position.is_dirty
+
+
+def test_position_is_dirty_after_price_write(pool):
+    position = pool.open_position(900, 1100, 100)
+    assert position.calculate_il() == 0.0
+    version = pool.version
+
+    pool._set_price(1050)
+
+    assert pool.version > version
+    assert position.is_dirty
+    assert position.calculate_il() != 0.0
+
+
+def test_collect_taxes_updates_total_return(pool):
+    position = pool.open_position(900, 1100, 100)
+    assert position.calculate_total_return() == 0.0
+
+    position.collect_taxes(np.array([0.01, 1.0]))
+
+    assert not position.is_dirty
+    assert position.calculate_total_return() > 0.0
+
+
+def test_pool_refresh_only_returns_stale_positions(pool):
+    first = pool.open_position(900, 1100, 100)
+    second = pool.open_position(500, 2000, 100)
+    assert pool.refresh() == [first, second]
+    assert pool.refresh() == []
+
+    first.collect_taxes(np.array([0.01, 1.0]))
+    assert pool.refresh() == []
+
+    pool._set_price(1050)
+    assert pool.refresh() == [first, second]
+
+
+def test_cached_metrics_match_fresh_recompute(pool):
+    position = pool.open_position(900, 1100, 100)
+    for price in [1050, 1200, 800, 1000]:
+        pool._set_price(price)
+        position.collect_taxes(np.array([0.01, 1.0]))
+        value, il, total_return = position.calculate_value(), position.calculate_il(), position.calculate_total_return()
+        assert (value, il, total_return) == pytest.approx(expected_metrics(position))
+
+
+def test_total_return_does_not_need_calculate_il(pool):
+    position = pool.open_position(900, 1100, 100)
+    pool._set_price(1200)
+    total_return = position.calculate_total_return()
+    assert total_return == pytest.approx(expected_metrics(position)[2])
+    assert total_return == pytest.approx(position.calculate_il())
+
+
+def test_refresh_does_not_withdraw_fees(pool):
+    position = pool.open_position(900, 1100, 100)
+    position.collect_taxes(np.array([0.01, 1.0]))
+    pool._set_price(1050)
+
+    assert pool.refresh() == [position]
+
+    assert list(position.fees) == [0.01, 1.0]
+    assert position.fees_withdraw == 0.0
+
+
+def test_total_return_withdraws_fees_at_the_price_of_the_call(pool):
+    position = pool.open_position(900, 1100, 100)
+    position.collect_taxes(np.array([1.0, 0.0]))
+
+    first_return = position.calculate_total_return()
+    assert position.fees_withdraw == pytest.approx(1000)
+    assert list(position.fees) == [0.0, 0.0]
+    assert first_return == pytest.approx(1000 / position.calculate_initial_value())
+
+    pool._set_price(1100)
+    second_return = position.calculate_total_return()
+    assert position.fees_withdraw == pytest.approx(1000)
+    assert second_return == pytest.approx((position.il + 1000) / position.calculate_initial_value())
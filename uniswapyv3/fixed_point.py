@@ -0,0 +1,234 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+
+# Q64.96 constants as defined by the UniswapV3 core contracts
+Q96: int = 1 << 96
+MIN_TICK: int = -887272
+MAX_TICK: int = -MIN_TICK
+MIN_SQRT_RATIO: int = 4295128739
+MAX_SQRT_RATIO: int = 1461446703485210103287273052203988822378723970342
+TICK_SIZE: float = 1.0001
+
+_UINT256_MAX: int = (1 << 256) - 1
+
+# Q128.128 multipliers for each bit of the absolute tick, taken from TickMath.getSqrtRatioAtTick
+_TICK_BIT_RATIOS: tuple[tuple[int, int], ...] = (
+    (0x2, 0xfff97272373d413259a46990580e213a),
+    (0x4, 0xfff2e50f5f656932ef12357cf3c7fdcc),
+    (0x8, 0xffe5caca7e10e4e61c3624eaa0941cd0),
+    (0x10, 0xffcb9843d60f6159c9db58835c926644),
+    (0x20, 0xff973b41fa98c081472e6896dfb254c0),
+    (0x40, 0xff2ea16466c96a3843ec78b326b52861),
+    (0x80, 0xfe5dee046a99a2a811c461f1969c3053),
+    (0x100, 0xfcbe86c7900a88aedcffc83b479aa3a4),
+    (0x200, 0xf987a7253ac413176f2b074cf7815e54),
+    (0x400, 0xf3392b0822b70005940c7a398e4b70f3),
+    (0x800, 0xe7159475a2c29b7443b29c7fa6e889d9),
+    (0x1000, 0xd097f3bdfd2022b8845ad8f792aa5825),
+    (0x2000, 0xa9f746462d870fdf8a65dc1f90e061e5),
+    (0x4000, 0x70d869a156d2a1b890bb3df62baf32f7),
+    (0x8000, 0x31be135f97d08fd981231505542fcfa6),
+    (0x10000, 0x9aa508b5b7a84e1c677de54f3e99bc9),
+    (0x20000, 0x5d6af8dedb81196699c329225ee604),
+    (0x40000, 0x2216e584f5fa1ea926041bedfe98),
+    (0x80000, 0x48a170391f7dc42444e8fa2),
+)
+_TICK_ODD_RATIO: int = 0xfffcb933bd6fad37aa2d162d1a594001
+_TICK_EVEN_RATIO: int = 1 << 128
+
+_LOG_SQRT_TICK_SIZE: float = math.log(TICK_SIZE) / 2
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """
+    Calculates sqrt(1.0001^tick) * 2^96 exactly as TickMath.getSqrtRatioAtTick does on-chain.
+
+    :param tick: The tick for which to compute the sqrt ratio.
+    :return: The sqrt price as a Q64.96 integer.
+    """
+    tick = int(tick)
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} is outside [{MIN_TICK}, {MAX_TICK}]")
+
+    ratio = _TICK_ODD_RATIO if abs_tick & 0x1 else _TICK_EVEN_RATIO
+    for bit, multiplier in _TICK_BIT_RATIOS:
+        if abs_tick & bit:
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = _UINT256_MAX // ratio
+
+    # Round up when going from Q128.128 to Q64.96
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+_MASK32 = np.uint64(0xffffffff)
+_SHIFT32 = np.uint64(32)
+_MASK64 = (1 << 64) - 1
+
+# Number of ticks processed at once by the limb arithmetic, small enough for the temporaries to stay in cache
+_LIMB_CHUNK_SIZE = 16384
+
+
+def _mul_hi_u64(a_lo: np.ndarray, a_hi: np.ndarray, b: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Full 64x64 -> 128 bit product of a uint64 array, given as 32 bit halves, and a 64 bit constant.
+
+    :return: The high and low uint64 limbs of the product.
+    """
+    b_lo, b_hi = np.uint64(b & 0xffffffff), np.uint64(b >> 32)
+    lo_lo = a_lo * b_lo
+    lo_hi = a_lo * b_hi
+    hi_lo = a_hi * b_lo
+    middle = (lo_lo >> _SHIFT32) + (lo_hi & _MASK32) + (hi_lo & _MASK32)
+    lo = (lo_lo & _MASK32) | (middle << _SHIFT32)
+    hi = a_hi * b_hi + (lo_hi >> _SHIFT32) + (hi_lo >> _SHIFT32) + (middle >> _SHIFT32)
+    return hi, lo
+
+
+def _mul_shift_128(hi: np.ndarray, lo: np.ndarray, multiplier: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Computes (ratio * multiplier) >> 128 on ratios stored as two uint64 limbs.
+
+    :param hi: The high limbs of the ratios.
+    :param lo: The low limbs of the ratios.
+    :param multiplier: A Q128.128 multiplier smaller than 2^128.
+    :return: The high and low limbs of the result.
+    """
+    m_hi, m_lo = multiplier >> 64, multiplier & _MASK64
+    lo_lo, lo_hi = lo & _MASK32, lo >> _SHIFT32
+    hi_lo, hi_hi = hi & _MASK32, hi >> _SHIFT32
+    h00, _ = _mul_hi_u64(lo_lo, lo_hi, m_lo)
+    h01, l01 = _mul_hi_u64(lo_lo, lo_hi, m_hi)
+    h10, l10 = _mul_hi_u64(hi_lo, hi_hi, m_lo)
+    h11, l11 = _mul_hi_u64(hi_lo, hi_hi, m_hi)
+
+    # Only the carries out of the second word are needed, they are summed as integers since
+    # adding two boolean arrays would be a logical or
+    word1 = h00 + l01
+    carry = (word1 < h00).astype(np.uint64)
+    carry += (word1 + l10) < word1
+
+    word2 = h01 + h10
+    carry2 = (word2 < h01).astype(np.uint64)
+    partial = word2 + l11
+    carry2 += partial < word2
+    word2 = partial + carry
+    carry2 += word2 < partial
+    return h11 + carry2, word2
+
+
+# Limbs of the multiplier of each bit position, indexed by log2(bit), used to start the ratio of even ticks
+_TICK_BIT_HI: np.ndarray = np.array([0] + [ratio >> 64 for _, ratio in _TICK_BIT_RATIOS], dtype=np.uint64)
+_TICK_BIT_LO: np.ndarray = np.array([0] + [ratio & _MASK64 for _, ratio in _TICK_BIT_RATIOS], dtype=np.uint64)
+
+
+def _get_sqrt_ratios_q128(abs_ticks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Runs the TickMath bit decomposition for the absolute ticks on uint64 limbs.
+
+    :return: The high and low limbs of the Q128.128 ratios. Tick 0, whose ratio is exactly
+        2^128 and does not fit in two limbs, is left as zero.
+    """
+    odd = (abs_ticks & 0x1) != 0
+    hi = np.full(abs_ticks.shape, np.uint64(_TICK_ODD_RATIO >> 64))
+    lo = np.full(abs_ticks.shape, np.uint64(_TICK_ODD_RATIO & _MASK64))
+
+    # Even ticks start from 2^128, multiplying it by the multiplier of the lowest set bit and
+    # shifting by 128 only copies the multiplier, so start from that and skip the bit
+    remaining = abs_ticks.copy()
+    even = np.flatnonzero(~odd & (abs_ticks != 0))
+    lowest_bit = abs_ticks[even] & -abs_ticks[even]
+    position = np.log2(lowest_bit).astype(np.int64)
+    hi[even], lo[even] = _TICK_BIT_HI[position], _TICK_BIT_LO[position]
+    remaining[even] ^= lowest_bit
+
+    for bit, multiplier in _TICK_BIT_RATIOS:
+        selected = np.flatnonzero(remaining & bit)
+        if selected.size:
+            hi[selected], lo[selected] = _mul_shift_128(hi[selected], lo[selected], multiplier)
+    return hi, lo
+
+
+def get_sqrt_ratios_at_ticks(ticks: np.ndarray) -> np.ndarray:
+    """
+    Batched version of get_sqrt_ratio_at_tick.
+
+    The Q128.128 products of TickMath run on uint64 limb arrays, so the multiply-shift for
+    each tick bit is a fixed set of NumPy operations over a chunk of ticks. Only the final
+    inversion of positive ticks and the rounding to Q64.96 use Python integers, since the
+    results do not fit in 128 bits.
+
+    :param ticks: Array of ticks.
+    :return: Object array with the Q64.96 sqrt price of each tick.
+    """
+    ticks = np.asarray(ticks, dtype=np.int64)
+    abs_ticks = np.abs(ticks)
+    if abs_ticks.size and abs_ticks.max() > MAX_TICK:
+        raise ValueError(f"Ticks must be inside [{MIN_TICK}, {MAX_TICK}]")
+
+    flat_ticks = abs_ticks.reshape(-1)
+    hi = np.empty(flat_ticks.size, dtype=np.uint64)
+    lo = np.empty(flat_ticks.size, dtype=np.uint64)
+    for start in range(0, flat_ticks.size, _LIMB_CHUNK_SIZE):
+        chunk = slice(start, start + _LIMB_CHUNK_SIZE)
+        hi[chunk], lo[chunk] = _get_sqrt_ratios_q128(flat_ticks[chunk])
+
+    ratios = ((hi.astype(object) << 64) | lo.astype(object)).reshape(ticks.shape)
+    ratios[ticks == 0] = _TICK_EVEN_RATIO
+
+    positive = ticks > 0
+    if positive.any():
+        ratios[positive] = _UINT256_MAX // ratios[positive]
+
+    # Round up when going from Q128.128 to Q64.96
+    return -((-ratios) >> 32)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """
+    Calculates the greatest tick whose sqrt ratio is less than or equal to the given one,
+    matching TickMath.getTickAtSqrtRatio.
+
+    :param sqrt_price_x96: The sqrt price as a Q64.96 integer.
+    :return: The greatest tick for which get_sqrt_ratio_at_tick(tick) <= sqrt_price_x96.
+    """
+    sqrt_price_x96 = int(sqrt_price_x96)
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"Sqrt ratio {sqrt_price_x96} is outside [{MIN_SQRT_RATIO}, {MAX_SQRT_RATIO})")
+
+    # The float estimate is at most a tick away, the exact ratios settle the boundary
+    estimate = math.floor((math.log(sqrt_price_x96) - 96 * math.log(2)) / _LOG_SQRT_TICK_SIZE)
+    tick = min(max(estimate, MIN_TICK), MAX_TICK)
+    while tick > MIN_TICK and get_sqrt_ratio_at_tick(tick) > sqrt_price_x96:
+        tick -= 1
+    while tick < MAX_TICK and get_sqrt_ratio_at_tick(tick + 1) <= sqrt_price_x96:
+        tick += 1
+    return tick
+
+
+def encode_price_sqrt(price: float) -> int:
+    """
+    Converts a price into its Q64.96 sqrt price, rounding down.
+
+    :param price: The price of token X in terms of token Y.
+    :return: floor(sqrt(price) * 2^96).
+    """
+    if price <= 0:
+        raise ValueError("Price must be positive")
+    price = Fraction(float(price))
+    return math.isqrt((price.numerator << 192) // price.denominator)
+
+
+def sqrt_price_x96_to_float(sqrt_price_x96: int) -> float:
+    """
+    Converts a Q64.96 sqrt price into a float, rounding to the nearest representable value.
+
+    :param sqrt_price_x96: The sqrt price as a Q64.96 integer.
+    :return: The sqrt price as a float.
+    """
+    return int(sqrt_price_x96) / Q96
+
@@ -1,13 +1,25 @@
 import numpy as np
+from typing import Optional
 from .position import LiquidityPosition
 from .utils import smallest_divisor
+from .fixed_point import (
+    Q96,
+    TICK_SIZE,
+    encode_price_sqrt,
+    get_sqrt_ratio_at_tick,
+    get_sqrt_ratios_at_ticks,
+    get_tick_at_sqrt_ratio,
+    sqrt_price_x96_to_float,
+)
+
+BACKENDS = ("float", "fixed")
 
 class LiquidityPool:
     """
     Represents a liquidity pool which manages liquidity providers, prices, and ticks.
     """
 
-    def __init__(self, tick_space: int, fee: float, tick_size: float = 1.0001, initial_price: float = 3000):
+    def __init__(self, tick_space: int, fee: float, tick_size: float = 1.0001, initial_price: float = 3000, backend: str = "float"):
         """
         Initializes a new instance of the LiquidityPool class.
 
@@ -15,7 +27,19 @@ class LiquidityPool:
         :param fee: The transaction fee percentage.
         :param tick_size: The multiplicative factor between successive price ticks.
         :param initial_price: The initial price level in the pool.
+        :param backend: "float" to track prices with floating point arithmetic, or "fixed" to track them
+            as Q64.96 integers following the on-chain TickMath, which requires tick_size=1.0001. The fixed
+            backend only makes the tick<->price conversions and the prices set by update_price exact, it does
+            not port SqrtPriceMath: liquidity, fees and the prices reached by swap still use float arithmetic.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if backend == "fixed" and tick_size != TICK_SIZE:
+            raise ValueError(f"The fixed backend follows the on-chain TickMath and requires tick_size={TICK_SIZE}")
+        self.backend: str = backend
+        self.version: int = 0  # Bumped every time the price moves, positions use it to know when their metrics are stale
+        self._sqrt_price_x96: Optional[int] = None  # Q64.96 sqrt price, only tracked by the fixed backend
+        self._sqrt_ratios_x96: Optional[np.ndarray] = None  # Q64.96 sqrt price of each tick in ticks_liquidity
         self.sqrt_tick_size: float = np.sqrt(tick_size)  # Price multiplier per tick
         self.tick_space: int = tick_space
         self.fee: float = fee
@@ -23,10 +47,67 @@ class LiquidityPool:
         self.lower_tick: int = self._price_to_tick(initial_price / 2)
         self.upper_tick: int = self._price_to_tick(initial_price * 2)  # Tracks the min and max ticks currently available in the pool
         self.ticks_liquidity: np.ndarray = np.zeros((self.upper_tick - self.lower_tick) // self.tick_space + 1)  # Array to store liquidity at each tick
-        self.sqrt_price: float = np.sqrt(initial_price)  # Current price level in the pool
+        self._extend_sqrt_ratios(self.lower_tick, self.upper_tick)
+        self._set_price(initial_price)  # Current price level in the pool
         self.current_tick: int = self._price_to_tick(self.sqrt_price**2)  # Current tick in the pool
         self.liquidity:float = 0
 
+    @property
+    def sqrt_price(self) -> float:
+        """
+        The square root of the current price in the pool.
+        """
+        if self.backend == "fixed":
+            return sqrt_price_x96_to_float(self.sqrt_price_x96)
+        return self._sqrt_price
+
+    @sqrt_price.setter
+    def sqrt_price(self, sqrt_price: float):
+        if self.backend == "fixed":
+            raise AttributeError("The fixed backend stores the price in sqrt_price_x96, set it or use update_price instead")
+        self._sqrt_price = sqrt_price
+        self.version += 1
+
+    @property
+    def sqrt_price_x96(self) -> Optional[int]:
+        """
+        The square root of the current price in the pool as a Q64.96 integer, only tracked by the fixed backend.
+        """
+        return self._sqrt_price_x96
+
+    @sqrt_price_x96.setter
+    def sqrt_price_x96(self, sqrt_price_x96: int):
+        if self.backend != "fixed":
+            raise AttributeError("Only the fixed backend tracks sqrt_price_x96, set sqrt_price instead")
+        self._sqrt_price_x96 = int(sqrt_price_x96)
+        self.version += 1
+
+    def _set_price(self, price: float) -> None:
+        """
+        Sets the current price in the pool. The fixed backend encodes the price directly into Q64.96,
+        without going through a float square root.
+
+        :param price: The new price of the pool.
+        """
+        if self.backend == "fixed":
+            self.sqrt_price_x96 = encode_price_sqrt(price)
+        else:
+            self.sqrt_price = np.sqrt(price)
+
+    def _set_sqrt_price(self, sqrt_price: float) -> None:
+        """
+        Sets the current sqrt price from the float arithmetic of swap. The fixed backend rounds it down
+        to Q64.96, so after a swap that moves the price it is only as precise as that float.
+
+        :param sqrt_price: The new sqrt price of the pool.
+        """
+        if sqrt_price == self.sqrt_price:
+            return  # The price did not move, keep the stored value as is
+        if self.backend == "fixed":
+            self.sqrt_price_x96 = int(float(sqrt_price) * Q96)
+        else:
+            self.sqrt_price = sqrt_price
+
     @staticmethod
     def _calc_delta_x(liquidity: float, current_price: float, future_price: float) -> float:
         return liquidity * (1 / current_price  - 1 / future_price)
@@ -148,7 +229,7 @@ class LiquidityPool:
         #Distribute the fees in each tick
         for tick,fees_paid in fees_dict.items():
             self._distribute_fees(self.current_tick, fees_paid, self.ticks_liquidity[tick])
-        self.sqrt_price = future_price
+        self._set_sqrt_price(future_price)
 
     def update_price(self, new_price: float):
         """
@@ -195,7 +276,8 @@ class LiquidityPool:
 
         current_idx: int = self._get_tick_index(current_tick)
         tick_liquidity: float = self.ticks_liquidity[current_idx]
-        future_price = np.sqrt(new_price)
+        self._set_price(new_price)
+        future_price = self.sqrt_price
 
         if direction == -1:
             delta: float = self._calc_delta_y(tick_liquidity,future_price,current_sqrt_price)
@@ -205,10 +287,18 @@ class LiquidityPool:
             fees_paid = np.array([0,delta / (1 - self.fee)])
 
         self._distribute_fees(self.current_tick, fees_paid, tick_liquidity)
-        self.sqrt_price = future_price
-
 
+    def refresh(self) -> list[LiquidityPosition]:
+        """
+        Recomputes the cached reserves, value and impermanent loss of the positions that are out of date
+        with the pool. Fees are not withdrawn.
 
+        :return: The positions that were refreshed.
+        """
+        refreshed = [provider for provider in self.providers if provider.is_dirty]
+        for provider in refreshed:
+            provider.refresh()
+        return refreshed
 
     def _distribute_fees(self, tick: int, fees_paid: np.ndarray, tick_liquidity: float) -> None:
         """
@@ -255,13 +345,46 @@ class LiquidityPool:
         # Extend the ticks_liquidity array to accommodate new ticks if necessary
         if upper_tick > self.upper_tick:
             self.ticks_liquidity = np.append(self.ticks_liquidity, np.zeros((upper_tick - self.upper_tick) // self.tick_space))
+            self._extend_sqrt_ratios(self.upper_tick + self.tick_space, upper_tick)
             self.upper_tick = upper_tick
         if lower_tick < self.lower_tick:
             self.ticks_liquidity = np.append(np.zeros((self.lower_tick - lower_tick) // self.tick_space), self.ticks_liquidity)
+            self._extend_sqrt_ratios(lower_tick, self.lower_tick - self.tick_space, prepend=True)
             self.lower_tick = lower_tick
 
         return lower_tick, upper_tick
 
+    def _extend_sqrt_ratios(self, first_tick: int, last_tick: int, prepend: bool = False) -> None:
+        """
+        Precomputes the exact Q64.96 sqrt price of the ticks added to the ticks_liquidity array in a single
+        batched call, so crossing ticks does not recompute TickMath one tick at a time.
+
+        :param first_tick: The first tick added to the array.
+        :param last_tick: The last tick added to the array.
+        :param prepend: Whether the ticks were added before or after the existing ones.
+        """
+        if self.backend != "fixed":
+            return
+        ratios = get_sqrt_ratios_at_ticks(np.arange(first_tick, last_tick + 1, self.tick_space))
+        if self._sqrt_ratios_x96 is None:
+            self._sqrt_ratios_x96 = ratios
+        elif prepend:
+            self._sqrt_ratios_x96 = np.concatenate((ratios, self._sqrt_ratios_x96))
+        else:
+            self._sqrt_ratios_x96 = np.concatenate((self._sqrt_ratios_x96, ratios))
+
+    def _tick_to_sqrt_price_x96(self, tick: int) -> int:
+        """
+        Converts a tick value to its exact Q64.96 sqrt price.
+
+        :param tick: The tick to convert.
+        :return: The Q64.96 sqrt price corresponding to the tick.
+        """
+        offset = tick - self.lower_tick
+        if self._sqrt_ratios_x96 is not None and offset % self.tick_space == 0 and 0 <= offset // self.tick_space < len(self._sqrt_ratios_x96):
+            return int(self._sqrt_ratios_x96[offset // self.tick_space])
+        return get_sqrt_ratio_at_tick(tick)
+
     def _tick_to_sqrt_price(self, tick: int) -> float:
         """
         Converts a tick value to a price.
@@ -269,6 +392,8 @@ class LiquidityPool:
         :param tick: The tick to convert.
         :return: The price corresponding to the tick.
         """
+        if self.backend == "fixed":
+            return sqrt_price_x96_to_float(self._tick_to_sqrt_price_x96(tick))
         return self.sqrt_tick_size ** tick
 
     def _price_to_tick(self, price: float) -> int:
@@ -278,6 +403,8 @@ class LiquidityPool:
         :param price: The price to convert.
         :return: The nearest tick corresponding to the price.
         """
+        if self.backend == "fixed":
+            return smallest_divisor(get_tick_at_sqrt_ratio(encode_price_sqrt(price)), self.tick_space)
         power_value = np.log(price) / np.log(self.sqrt_tick_size) / 2
         return smallest_divisor(power_value, self.tick_space)
 
@@ -1,4 +1,5 @@
 import numpy as np
+from typing import Optional
 
 class LiquidityPosition:
     """
@@ -30,6 +31,8 @@ class LiquidityPosition:
         The minimum tick range for the position.
     max_tick : int
         The maximum tick range for the position.
+    is_dirty : bool
+        Whether the cached reserves, value and impermanent loss are out of date with the pool.
     """
 
     def __init__(self, max_tick: int, min_tick: int,pool, liquidity: float = 100):
@@ -48,6 +51,13 @@ class LiquidityPosition:
             The amount of liquidity provided by the position (default is 100).
         """
         self.pool = pool
+        # Cached metrics, recomputed lazily when the pool version or the fees change
+        self.current_value: float = 0.0
+        self._hodl_value: float = 0.0
+        self._il_ratio: float = 0.0
+        self._total_return: Optional[float] = None
+        self._fees_dirty: bool = False
+        self._version: Optional[int] = None  # Pool version the cached metrics were computed at
         self.min_tick: int = min_tick
         self.max_tick: int = max_tick
         self._set_tick_range()
@@ -58,6 +68,29 @@ class LiquidityPosition:
         self.fees: np.ndarray = np.array([0.0,0.0])
         self.fees_withdraw: float = 0.0
         self.il: float = 0.0
+
+    @property
+    def is_dirty(self) -> bool:
+        """
+        Whether the pool price moved since the reserves, value and impermanent loss were last computed.
+        """
+        return self._version != self.pool.version
+
+    def refresh(self):
+        """
+        Recompute the cached reserves, value and impermanent loss if the pool price moved.
+        Fees are left untouched, they are only withdrawn by calculate_total_return.
+        """
+        if self._version == self.pool.version:
+            return
+        self.update_reserves()
+        self.current_value = self.x * self.pool.sqrt_price**2 + self.y
+        self._hodl_value = self.calculate_initial_value()
+        self.il = self.current_value - self._hodl_value
+        self._il_ratio = self.il / self._hodl_value
+        self._total_return = None  # The total return depends on the IL
+        self._version = self.pool.version
+
     def update_reserves(self):
         """
         Update the reserves of token X and Y based on the new price in the pool.
@@ -82,7 +115,7 @@ class LiquidityPosition:
         float
             The current value of the portfolio.
         """
-        self.current_value = self.x * self.pool.sqrt_price**2 + self.y
+        self.refresh()
         return self.current_value
 
     def calculate_initial_value(self) -> float:
@@ -106,11 +139,8 @@ class LiquidityPosition:
         float
             The impermanent loss (IL) of the position.
         """
-        self.update_reserves()
-        current_value: float = self.calculate_value()
-        hodl_value: float = self.calculate_initial_value()
-        self.il: float =  (current_value - hodl_value)
-        return self.il / hodl_value
+        self.refresh()
+        return self._il_ratio
 
     def calculate_total_return(self) -> float:
         """
@@ -121,9 +151,10 @@ class LiquidityPosition:
         float
             The total return of the position.
         """
-        hodl_value = self.calculate_initial_value()
-        fees = self._withdraw_taxes()
-        return ( self.il + fees ) / hodl_value
+        self.refresh()
+        if self._fees_dirty or self._total_return is None:
+            self._total_return = (self.il + self._withdraw_taxes()) / self._hodl_value
+        return self._total_return
 
 
     def check_tick_range(self, tick: int) -> bool:
@@ -152,13 +183,16 @@ class LiquidityPosition:
             The amount of fees received.
         """
         self.fees += fees_received
+        self._fees_dirty = True
 
     def _withdraw_taxes(self) -> float:
         """
         Withdraw taxes from the current pool.
         """
-        self.fees_withdraw += self.fees[0] * (self.pool.sqrt_price ** 2) + self.fees[1]
-        self.fees = np.array([0.0, 0.0])
+        if self._fees_dirty:
+            self.fees_withdraw += self.fees[0] * (self.pool.sqrt_price ** 2) + self.fees[1]
+            self.fees.fill(0.0)
+            self._fees_dirty = False
         return self.fees_withdraw
 
     def _set_tick_range(self,):
@@ -173,5 +207,6 @@ class LiquidityPosition:
             The maximum tick range.
         """
         # Update max and min range for the exaclty tick
-        self.max_range = self.pool.sqrt_tick_size ** (self.max_tick + 1)
-        self.min_range = self.pool.sqrt_tick_size ** self.min_tick
+        self.max_range = self.pool._tick_to_sqrt_price(self.max_tick + 1)
+        self.min_range = self.pool._tick_to_sqrt_price(self.min_tick)
+        self._version = None  # Reserves depend on the range, so the cached metrics are stale